@@ -3,6 +3,7 @@
 EMU Audity to Zenology Bank Generator
 Creates authentic EMU Z-plane Zenology banks from our extracted EMU data
 Usage: python emu_to_zenology.py [--bank_name "Custom EMU Bank"] [--output emu_audity.bin]
+                                  [--codec zlib|zstd] [--compress-level N]
 """
 
 import sys
@@ -10,8 +11,39 @@ import os
 import json
 import struct
 import zlib
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson  # Optional: C-extension JSON, much faster than stdlib
+except ImportError:
+    orjson = None
+
+def load_json(path):
+    """Load JSON from path, via orjson when available"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Binary preset record: 16-byte name, filter/LFO/env floats, EMU flag,
+# Z-plane mode, then 8 modulation slots of (depth, source)
+PRESET_NAME_SIZE = 16
+MOD_SLOTS = 8
+_PRESET_LAYOUT = struct.Struct(f'<{PRESET_NAME_SIZE}sffffII' + 'fI' * MOD_SLOTS)
+PRESET_SIZE = _PRESET_LAYOUT.size
+_EMPTY_MOD_SLOTS = (0.0, 0) * MOD_SLOTS
+
+# Presets packed per write when streaming a bank (8 x 104 bytes fits well under 4 KiB)
+PRESETS_PER_CHUNK = 8
+
+# Compression codecs and their default levels: zlib 6 for bank-generation
+# throughput (9 costs ~3x the CPU for a marginal ratio gain), zstd 15 for
+# archival/max-ratio output
+CODECS = ("zlib", "zstd")
+DEFAULT_COMPRESS_LEVELS = {"zlib": 6, "zstd": 15}
+COMPRESS_LEVEL_RANGES = {"zlib": (0, 9), "zstd": (1, 22)}  # Inclusive
+
 def create_zenology_header():
     """Create SVZa header structure"""
     header = bytearray()
@@ -29,10 +61,20 @@ def create_zenology_header():
 
     return header
 
-def create_emu_preset_data(emu_presets, bank_name="Authentic EMU Audity"):
-    """Convert EMU preset data to Zenology-compatible format"""
+# The header is constant, so build it once; callers copy it before patching sizes
+_HEADER_TEMPLATE = bytes(create_zenology_header())
+
+# SVZa size fields: total size overwrites bytes 16-19 of the header template,
+# compressed size follows the template directly
+HEADER_TOTAL_SIZE_OFFSET = 16
+HEADER_COMPRESSED_SIZE_OFFSET = len(_HEADER_TEMPLATE)
+
+def encode_preset_name(name):
+    """Encode a preset name as NUL-padded 16-byte ASCII (15 chars max)"""
+    return name[:PRESET_NAME_SIZE - 1].encode('ascii', 'replace').ljust(PRESET_NAME_SIZE, b'\x00')
 
-    preset_data = bytearray()
+def build_preset_entries(emu_presets, bank_name="Authentic EMU Audity"):
+    """Map EMU presets to the 32 Zenology preset entries of a bank"""
 
     # Bank metadata
     bank_header = {
@@ -45,8 +87,8 @@ def create_emu_preset_data(emu_presets, bank_name="Authentic EMU Audity"):
     preset_entries = []
 
     for i, preset in enumerate(emu_presets[:32]):  # Limit to 32 presets for bank
-        # Clean preset name (Zenology uses 16-char names)
-        name = preset.get("name", f"EMU Preset {i+1}")[:15].ljust(16, '\x00')
+        # Clean preset name (Zenology uses 16-char names), encoded once
+        name_bytes = encode_preset_name(preset.get("name", f"EMU Preset {i+1}"))
 
         # Extract EMU parameters
         lfo_rate = preset.get("lfo", {}).get("lfo1", {}).get("rateHz", 0.5)
@@ -54,19 +96,20 @@ def create_emu_preset_data(emu_presets, bank_name="Authentic EMU Audity"):
 
         # Modulation matrix (essential for EMU character)
         mods = preset.get("mods", [])
+        cutoff_depth, t2_depth, mod_matrix, zplane_mode = analyze_mods(mods)
 
         # Create Zenology preset structure
         preset_entry = {
-            "name": name.rstrip('\x00'),
+            "name_bytes": name_bytes,
             "parameters": {
                 # Map EMU filter parameters to Zenology equivalents
-                "filter_cutoff": extract_cutoff_mods(mods),
-                "filter_resonance": extract_t2_mods(mods),
+                "filter_cutoff": cutoff_depth,
+                "filter_resonance": t2_depth,
                 "lfo1_rate": lfo_rate,
                 "env1_attack": max(0, env_attack),
-                "modulation_matrix": convert_modulation_matrix(mods),
+                "modulation_matrix": mod_matrix,
                 "emu_character": True,
-                "z_plane_mode": determine_zplane_mode(mods)
+                "z_plane_mode": zplane_mode
             }
         }
 
@@ -75,7 +118,7 @@ def create_emu_preset_data(emu_presets, bank_name="Authentic EMU Audity"):
     # Fill remaining slots with default presets if needed
     while len(preset_entries) < 32:
         default_preset = {
-            "name": f"EMU Init {len(preset_entries)+1}",
+            "name_bytes": encode_preset_name(f"EMU Init {len(preset_entries)+1}"),
             "parameters": {
                 "filter_cutoff": 0.5,
                 "filter_resonance": 0.2,
@@ -87,141 +130,205 @@ def create_emu_preset_data(emu_presets, bank_name="Authentic EMU Audity"):
         }
         preset_entries.append(default_preset)
 
-    # Convert to binary format (simplified Zenology structure)
-    for preset in preset_entries:
-        # Preset name (16 bytes)
-        name_bytes = preset["name"][:15].encode('ascii').ljust(16, b'\x00')
-        preset_data.extend(name_bytes)
-
-        # Parameter data (64 bytes per preset - typical for Zenology)
-        params = preset["parameters"]
-
-        # Filter parameters (EMU Z-plane coefficients)
-        preset_data.extend(struct.pack('<f', params.get("filter_cutoff", 0.5)))
-        preset_data.extend(struct.pack('<f', params.get("filter_resonance", 0.2)))
-
-        # LFO/Envelope parameters
-        preset_data.extend(struct.pack('<f', params.get("lfo1_rate", 0.5)))
-        preset_data.extend(struct.pack('<f', params.get("env1_attack", 0.1)))
-
-        # EMU character flag
-        preset_data.extend(struct.pack('<I', 1 if params.get("emu_character") else 0))
-
-        # Z-plane mode (0=Air, 1=Liquid, 2=Punch)
-        zplane_modes = {"Air": 0, "Liquid": 1, "Punch": 2}
-        mode_val = zplane_modes.get(params.get("z_plane_mode", "Air"), 0)
-        preset_data.extend(struct.pack('<I', mode_val))
-
-        # Modulation matrix (simplified - 8 slots of 8 bytes each)
-        mod_matrix = params.get("modulation_matrix", [])
-        for j in range(8):
-            if j < len(mod_matrix):
-                mod = mod_matrix[j]
-                preset_data.extend(struct.pack('<f', mod.get("depth", 0.0)))
-                preset_data.extend(struct.pack('<I', mod.get("source", 0)))
-            else:
-                preset_data.extend(b'\x00' * 8)  # Empty mod slot
+    return preset_entries
 
-    return preset_data
+_ZPLANE_MODES = {"Air": 0, "Liquid": 1, "Punch": 2}
 
-def extract_cutoff_mods(mods):
-    """Extract filter cutoff modulation strength from EMU mods"""
-    cutoff_mods = [m for m in mods if "filter.cutoff" in m.get("dst", "")]
-    if cutoff_mods:
-        # Average cutoff modulation depth
-        depths = [m.get("depth", 0.0) for m in cutoff_mods]
-        return sum(depths) / len(depths)
-    return 0.5  # Default
-
-def extract_t2_mods(mods):
-    """Extract T2 coefficient modulation (resonance-like) from EMU mods"""
-    t2_mods = [m for m in mods if "filter.t2" in m.get("dst", "")]
-    if t2_mods:
-        depths = [m.get("depth", 0.0) for m in t2_mods]
-        return sum(depths) / len(depths)
-    return 0.2  # Default resonance
-
-def convert_modulation_matrix(mods):
-    """Convert EMU modulation matrix to simplified Zenology format"""
-    converted_mods = []
+def pack_preset(buffer, offset, preset):
+    """Pack one preset entry into buffer at offset (PRESET_SIZE bytes)"""
+    params = preset["parameters"]
 
-    # Map EMU sources to Zenology equivalents
-    source_map = {
-        "LFO1": 0, "LFO2": 1, "ENV1": 2, "ENV2": 3,
-        "ENV3": 4, "ENV4": 5, "KEY": 6, "VEL": 7,
-        "MIDI_CC1": 8, "MIDI_CC2": 9, "MIDI_CC7": 10
-    }
+    # Z-plane mode (0=Air, 1=Liquid, 2=Punch)
+    mode_val = _ZPLANE_MODES.get(params.get("z_plane_mode", "Air"), 0)
 
-    for mod in mods[:8]:  # Limit to 8 modulations
-        src = mod.get("src", "")
-        depth = mod.get("depth", 0.0)
+    # Modulation matrix (simplified - 8 slots of 8 bytes each), zero-padded
+    mod_matrix = params.get("modulation_matrix", [])[:MOD_SLOTS]
+    mod_fields = tuple(value for mod in mod_matrix
+                       for value in (mod.get("depth", 0.0), mod.get("source", 0)))
+    mod_fields += _EMPTY_MOD_SLOTS[len(mod_fields):]
+
+    # Whole record in one call: name, filter (EMU Z-plane coefficients),
+    # LFO/envelope, EMU character flag, Z-plane mode, modulation slots
+    _PRESET_LAYOUT.pack_into(
+        buffer, offset,
+        preset["name_bytes"],
+        params.get("filter_cutoff", 0.5),
+        params.get("filter_resonance", 0.2),
+        params.get("lfo1_rate", 0.5),
+        params.get("env1_attack", 0.1),
+        1 if params.get("emu_character") else 0,
+        mode_val,
+        *mod_fields)
+
+def create_emu_preset_data(emu_presets, bank_name="Authentic EMU Audity"):
+    """Convert EMU preset data to Zenology-compatible format"""
+    preset_entries = build_preset_entries(emu_presets, bank_name)
 
-        source_id = source_map.get(src, 0)
+    # Convert to binary format (simplified Zenology structure)
+    preset_data = bytearray(len(preset_entries) * PRESET_SIZE)
+    for i, preset in enumerate(preset_entries):
+        pack_preset(preset_data, i * PRESET_SIZE, preset)
 
-        converted_mods.append({
-            "source": source_id,
-            "depth": depth,
-            "destination": "filter_cutoff"  # Simplified - most EMU mods target cutoff
-        })
+    return preset_data
 
-    return converted_mods
+def iter_preset_chunks(preset_entries, presets_per_chunk=PRESETS_PER_CHUNK):
+    """
+    Yield packed presets a few at a time from one reusable buffer.
+
+    Each yielded memoryview is overwritten by the next chunk, so consume
+    it (e.g. feed it to a compressor) before advancing.
+    """
+    buffer = bytearray(presets_per_chunk * PRESET_SIZE)
+    view = memoryview(buffer)
+
+    for start in range(0, len(preset_entries), presets_per_chunk):
+        chunk = preset_entries[start:start + presets_per_chunk]
+        for j, preset in enumerate(chunk):
+            pack_preset(buffer, j * PRESET_SIZE, preset)
+        yield view[:len(chunk) * PRESET_SIZE]
+
+# Map EMU sources to Zenology equivalents
+MOD_SOURCE_MAP = {
+    "LFO1": 0, "LFO2": 1, "ENV1": 2, "ENV2": 3,
+    "ENV3": 4, "ENV4": 5, "KEY": 6, "VEL": 7,
+    "MIDI_CC1": 8, "MIDI_CC2": 9, "MIDI_CC7": 10
+}
+
+def analyze_mods(mods):
+    """
+    Derive all Zenology mod-based parameters from EMU mods in one pass.
+
+    Returns (cutoff_depth, t2_depth, modulation_matrix, z_plane_mode):
+    average filter.cutoff depth (default 0.5), average filter.t2
+    (resonance-like) depth (default 0.2), the first 8 mods converted to
+    Zenology slots, and the Z-plane style guessed from modulation sources.
+    """
+    cutoff_sum = 0.0
+    cutoff_n = 0
+    t2_sum = 0.0
+    t2_n = 0
+    lfo_mods = env_mods = key_mods = 0
+    converted_mods = []
 
-def determine_zplane_mode(mods):
-    """Determine Z-plane style based on modulation characteristics"""
-    # Analyze modulation patterns to guess EMU style
+    for mod in mods:
+        dst = mod.get("dst", "")
+        src = mod.get("src", "")
+        depth = mod.get("depth", 0.0)
 
-    lfo_mods = len([m for m in mods if "LFO" in m.get("src", "")])
-    env_mods = len([m for m in mods if "ENV" in m.get("src", "")])
-    key_mods = len([m for m in mods if "KEY" in m.get("src", "")])
+        if "filter.cutoff" in dst:
+            cutoff_sum += depth
+            cutoff_n += 1
+        if "filter.t2" in dst:
+            t2_sum += depth
+            t2_n += 1
+
+        if "LFO" in src:
+            lfo_mods += 1
+        if "ENV" in src:
+            env_mods += 1
+        if "KEY" in src:
+            key_mods += 1
+
+        # Limit to 8 modulations
+        if len(converted_mods) < MOD_SLOTS:
+            converted_mods.append({
+                "source": MOD_SOURCE_MAP.get(src, 0),
+                "depth": depth,
+                "destination": "filter_cutoff"  # Simplified - most EMU mods target cutoff
+            })
+
+    cutoff_depth = cutoff_sum / cutoff_n if cutoff_n else 0.5
+    t2_depth = t2_sum / t2_n if t2_n else 0.2
 
     # Heuristic mapping based on modulation complexity
     if lfo_mods >= 2 and env_mods >= 3:
-        return "Punch"  # Complex modulation = aggressive character
+        zplane_mode = "Punch"   # Complex modulation = aggressive character
     elif key_mods >= 5:
-        return "Liquid"  # Key scaling = smooth character
+        zplane_mode = "Liquid"  # Key scaling = smooth character
     else:
-        return "Air"    # Default = bright character
+        zplane_mode = "Air"     # Default = bright character
+
+    return cutoff_depth, t2_depth, converted_mods, zplane_mode
+
+@lru_cache(maxsize=None)
+def _zlib_compressor(level):
+    """Unused zlib compressor for level; callers compress with a .copy()"""
+    return zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS, 8)
 
-def create_zenology_bank(emu_data_file, bank_name="Authentic EMU Audity", output_file="emu_audity.bin"):
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd codec requires the 'zstandard' package")
+    return zstandard
+
+def new_compressor(codec="zlib", level=None, size=-1):
+    """
+    Streaming compressor (compress()/flush()) for the selected codec.
+    size: total input length if known, recorded in zstd frame headers
+    """
+    if level is None:
+        level = DEFAULT_COMPRESS_LEVELS[codec]
+
+    if codec == "zlib":
+        # Copy a pristine deflate state instead of initialising a new one per bank
+        return _zlib_compressor(level).copy()
+
+    if codec == "zstd":
+        return _import_zstandard().ZstdCompressor(level=level).compressobj(size=size)
+
+    raise ValueError(f"Unknown codec: {codec}")
+
+def create_zenology_bank(emu_data_file, bank_name="Authentic EMU Audity", output_file="emu_audity.bin",
+                         codec="zlib", compress_level=None):
     """Create complete Zenology bank from EMU data"""
 
     # Load EMU preset data
-    with open(emu_data_file, 'r') as f:
-        emu_data = json.load(f)
+    emu_data = load_json(emu_data_file)
 
     emu_presets = emu_data.get("presets", [])
     print(f"Loaded {len(emu_presets)} EMU presets from {emu_data['meta']['bank']}")
 
-    # Create preset data
-    preset_data = create_emu_preset_data(emu_presets, bank_name)
-    print(f"Generated {len(preset_data)} bytes of preset data")
-
-    # Compress the preset data
-    compressed_data = zlib.compress(preset_data, level=9)
-    print(f"Compressed to {len(compressed_data)} bytes")
-
-    # Create complete SVZa file
-    header = create_zenology_header()
-
-    # Calculate header fields
-    total_size = len(header) + len(compressed_data) + 64  # +64 for metadata
-    compressed_size = len(compressed_data)
+    # Create preset entries; they are packed and compressed chunk by chunk below
+    preset_entries = build_preset_entries(emu_presets, bank_name)
+    print(f"Generated {len(preset_entries) * PRESET_SIZE} bytes of preset data")
 
-    # Update header with sizes
-    header[16:20] = struct.pack('<I', total_size)
-    header[32:36] = struct.pack('<I', compressed_size)
+    # Uncompressed size is known up front, so zstd frames still record it
+    compressor = new_compressor(codec, compress_level, len(preset_entries) * PRESET_SIZE)
+    header = _HEADER_TEMPLATE
 
-    # Add zlib header marker
-    header.extend(b'\x78\x9c')  # zlib deflate header
-
-    # Complete file
-    complete_file = header + compressed_data
-
-    # Write output
+    # Stream the SVZa file: header with placeholder sizes, then compressed
+    # chunks as they are produced, then patch the sizes in place
     with open(output_file, 'wb') as f:
-        f.write(complete_file)
-
-    print(f"Created Zenology bank: {output_file} ({len(complete_file)} bytes)")
+        f.write(header)
+        f.write(b'\x00' * 4)  # Compressed size, patched below
+
+        # Add zlib header marker (zstd frames carry their own magic)
+        if codec == "zlib":
+            f.write(b'\x78\x9c')  # zlib deflate header
+
+        compressed_size = 0
+        for chunk in iter_preset_chunks(preset_entries):
+            block = compressor.compress(chunk)
+            f.write(block)
+            compressed_size += len(block)
+        block = compressor.flush()
+        f.write(block)
+        compressed_size += len(block)
+
+        # Calculate header fields
+        total_size = len(header) + compressed_size + 64  # +64 for metadata
+
+        # Update header with sizes
+        f.seek(HEADER_TOTAL_SIZE_OFFSET)
+        f.write(struct.pack('<I', total_size))
+        f.seek(HEADER_COMPRESSED_SIZE_OFFSET)
+        f.write(struct.pack('<I', compressed_size))
+
+        file_size = f.seek(0, os.SEEK_END)
+
+    print(f"Compressed to {compressed_size} bytes ({codec})")
+    print(f"Created Zenology bank: {output_file} ({file_size} bytes)")
     print(f"Bank name: {bank_name}")
     print(f"Source: {emu_data['meta']['bank']} EMU presets")
 
@@ -242,6 +349,28 @@ def main():
         if idx + 1 < len(sys.argv):
             output_file = sys.argv[idx + 1]
 
+    codec = "zlib"
+    if "--codec" in sys.argv:
+        idx = sys.argv.index("--codec")
+        if idx + 1 < len(sys.argv):
+            codec = sys.argv[idx + 1]
+    if codec not in CODECS:
+        print(f"Error: Unknown codec '{codec}' (expected one of: {', '.join(CODECS)})")
+        return 1
+
+    compress_level = None
+    if "--compress-level" in sys.argv:
+        idx = sys.argv.index("--compress-level")
+        if idx + 1 < len(sys.argv):
+            lo, hi = COMPRESS_LEVEL_RANGES[codec]
+            try:
+                compress_level = int(sys.argv[idx + 1])
+            except ValueError:
+                compress_level = None
+            if compress_level is None or not lo <= compress_level <= hi:
+                print(f"Error: Invalid compress level '{sys.argv[idx + 1]}' for {codec} (expected {lo}-{hi})")
+                return 1
+
     # Default to Orbit-3 data if available
     emu_data_files = [
         "../../tools/banks/emu/extracted/Orbit3_Authentic.json",
@@ -261,7 +390,8 @@ def main():
         return 1
 
     try:
-        created_file = create_zenology_bank(emu_data_file, bank_name, output_file)
+        created_file = create_zenology_bank(emu_data_file, bank_name, output_file,
+                                            codec, compress_level)
         print(f"\n✓ Success! Created authentic EMU Audity Zenology bank: {created_file}")
         print("This bank contains genuine EMU Z-plane coefficient data extracted from Audity 2000 presets.")
         print("Load it into Zenology/Roland Cloud for authentic vintage EMU character!")
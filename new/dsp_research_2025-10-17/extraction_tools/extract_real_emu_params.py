@@ -7,10 +7,153 @@ Usage:
     python extract_real_emu_params.py "C:\path\to\A2K" --output emu_params.json
 """
 
+import os
+import re
 import sys
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson  # Optional: C-extension JSON, much faster than stdlib
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj, path):
+    """Write obj to path as indented JSON, via orjson when available"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2)
+
+
+def _cutoff_hz(raw: int) -> float:
+    # EMU filters typically range 20Hz to 20kHz
+    # 14-bit value, exponential mapping
+    normalized = raw / 16383.0
+    return 20.0 * (1000.0 ** normalized)
+
+
+def _time_ms(raw: int) -> float:
+    # Typical EMU envelope range: 0.5ms to 10s
+    # Exponential curve
+    if raw == 0:
+        return 0.5
+    normalized = raw / 127.0
+    return 0.5 + (10000.0 * (normalized ** 2))
+
+
+def _lfo_hz(raw: int) -> float:
+    # LFO range typically 0.01 Hz to 100 Hz
+    # Center value (64) = 2 Hz (1 bar @ 120 BPM)
+    if raw < 64:
+        # Below center: 0.01 to 2.0 Hz
+        normalized = raw / 64.0
+        return 0.01 + (1.99 * normalized)
+    else:
+        # Above center: 2.0 to 100 Hz
+        normalized = (raw - 64) / 63.0
+        return 2.0 + (98.0 * normalized)
+
+
+# Raw SysEx values are 14-bit (cutoff) or 7-bit, so every conversion is
+# tabulated once at import; values are built with the scalar formulas so
+# lookups match them exactly
+CUTOFF_LUT = [_cutoff_hz(raw) for raw in range(1 << 14)]
+TIME_LUT = [_time_ms(raw) for raw in range(1 << 7)]
+LFO_LUT = [_lfo_hz(raw) for raw in range(1 << 7)]
+
+
+def apply_lut(lut: List[float], raws: List[int], convert) -> List[float]:
+    """Convert a whole raw column via lut; values outside the table use convert"""
+    size = len(lut)
+    return [lut[raw] if raw < size else convert(raw) for raw in raws]
+
+
+def preset_record(row: Tuple, cutoff_hz: float, attack_ms: float, decay_ms: float,
+                  release_ms: float, lfo_hz: float) -> Dict:
+    """Build the legacy per-preset dict from a row tuple and its converted values"""
+    (filename, preset_name, preset_num, rom_id, num_layers, cutoff_raw, res_raw,
+     attack_raw, decay_raw, sustain_raw, release_raw, rate_raw, depth_raw) = row
+    return {
+        "filename": filename,
+        "preset_name": preset_name,
+        "preset_num": preset_num,
+        "rom_id": rom_id,
+        "num_layers": num_layers,
+        "filter_params": {
+            "cutoff_raw": cutoff_raw,
+            "cutoff_hz": cutoff_hz,
+            "resonance_raw": res_raw,
+            "resonance": res_raw / 127.0,
+        },
+        "envelope_params": {
+            "attack_raw": attack_raw,
+            "attack_ms": attack_ms,
+            "decay_raw": decay_raw,
+            "decay_ms": decay_ms,
+            "sustain_raw": sustain_raw,
+            "sustain": sustain_raw / 127.0,
+            "release_raw": release_raw,
+            "release_ms": release_ms,
+        },
+        "lfo_params": {
+            "rate_raw": rate_raw,
+            "rate_hz": lfo_hz,
+            "depth_raw": depth_raw,
+            "depth": depth_raw / 127.0,
+        },
+    }
+
+
+@dataclass
+class PresetSoA:
+    """Parsed preset records stored column-wise: one list per field"""
+
+    filenames: List[str] = field(default_factory=list)
+    preset_names: List[str] = field(default_factory=list)
+    preset_nums: List[int] = field(default_factory=list)
+    rom_ids: List[int] = field(default_factory=list)
+    num_layers: List[int] = field(default_factory=list)
+    cutoff_raws: List[int] = field(default_factory=list)
+    resonance_raws: List[int] = field(default_factory=list)
+    attack_raws: List[int] = field(default_factory=list)
+    decay_raws: List[int] = field(default_factory=list)
+    sustain_raws: List[int] = field(default_factory=list)
+    release_raws: List[int] = field(default_factory=list)
+    lfo_rate_raws: List[int] = field(default_factory=list)
+    lfo_depth_raws: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    def columns(self) -> List[List]:
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def append(self, row: Tuple):
+        """Append one row tuple (fields in column order)"""
+        for column, value in zip(self.columns(), row):
+            column.append(value)
+
+    def to_records(self) -> List[Dict]:
+        """Expand columns into the legacy per-preset dict layout for JSON output"""
+        cutoff_hz = apply_lut(CUTOFF_LUT, self.cutoff_raws, _cutoff_hz)
+        attack_ms = apply_lut(TIME_LUT, self.attack_raws, _time_ms)
+        decay_ms = apply_lut(TIME_LUT, self.decay_raws, _time_ms)
+        release_ms = apply_lut(TIME_LUT, self.release_raws, _time_ms)
+        lfo_hz = apply_lut(LFO_LUT, self.lfo_rate_raws, _lfo_hz)
+
+        return [
+            preset_record(row, *converted)
+            for row, converted in zip(zip(*self.columns()),
+                                      zip(cutoff_hz, attack_ms, decay_ms, release_ms, lfo_hz))
+        ]
+
 
 class EmuSysExParser:
     """Parse EMU Audity/Proteus SysEx dumps"""
@@ -25,12 +168,25 @@ class EmuSysExParser:
     SUB_LAYER_ENV = 0x24
     SUB_LAYER_CORDS = 0x25
 
+    # Raw parameter offsets within the 32-byte preset data section.
+    # These are heuristic based on known EMU parameter layouts;
+    # real parsing would require full SysEx spec interpretation.
+    DATA_CUTOFF_LSB = 8    # Cutoff, 14-bit (typically higher values = open filter)
+    DATA_CUTOFF_MSB = 9
+    DATA_RESONANCE = 10
+    DATA_ATTACK = 12       # Envelope timing is typically in low bytes
+    DATA_DECAY = 13
+    DATA_SUSTAIN = 14
+    DATA_RELEASE = 15
+    DATA_LFO_RATE = 16
+    DATA_LFO_DEPTH = 17
+
     def __init__(self):
         self.manufacturer_id = 0x18  # E-MU
         self.family_id = 0x0F        # Proteus family
 
-    def parse_sysex_file(self, path: Path) -> Optional[Dict]:
-        """Parse single SysEx file"""
+    def read_preset_dump(self, path: Path) -> Optional[bytes]:
+        """Read a SysEx file, returning its bytes only if it is a preset dump header"""
         try:
             with open(path, 'rb') as f:
                 data = f.read()
@@ -51,9 +207,9 @@ class EmuSysExParser:
             cmd = data[5]
             subcmd = data[6]
 
-            # Parse preset dump header (0x10 0x01/0x03)
+            # Preset dump header (0x10 0x01/0x03)
             if cmd == self.CMD_PRESET_DUMP_HEADER and subcmd in (0x01, 0x03):
-                return self.parse_preset_header(data, path)
+                return data
 
             return None
 
@@ -61,11 +217,40 @@ class EmuSysExParser:
             print(f"Error parsing {path.name}: {e}")
             return None
 
+    def parse_sysex_file(self, path: Path) -> Optional[Dict]:
+        """Parse single SysEx file"""
+        data = self.read_preset_dump(path)
+        if data is None:
+            return None
+        return self.parse_preset_header(data, path)
+
+    def parse_sysex_fields(self, path: Path) -> Optional[Tuple]:
+        """Parse single SysEx file into a PresetSoA row tuple"""
+        data = self.read_preset_dump(path)
+        if data is None:
+            return None
+        return self.parse_preset_fields(data, path)
+
     def parse_preset_header(self, data: bytes, path: Path) -> Dict:
         """
         Parse preset dump header
         Format: ... 10 01 <preset#> <32 bytes data> <counts> <ROM ID> F7
         """
+        row = self.parse_preset_fields(data, path)
+        if row is None:
+            return None
+
+        return preset_record(
+            row,
+            self.raw_to_cutoff_hz(row[5]),
+            self.raw_to_time_ms(row[7]),
+            self.raw_to_time_ms(row[8]),
+            self.raw_to_time_ms(row[10]),
+            self.raw_to_lfo_hz(row[11]),
+        )
+
+    def parse_preset_fields(self, data: bytes, path: Path) -> Optional[Tuple]:
+        """Parse preset dump header into a row tuple in PresetSoA column order"""
         payload = data[7:-1]  # Strip F0 header and F7
 
         if len(payload) < 50:
@@ -82,138 +267,113 @@ class EmuSysExParser:
 
         # Count section starts at offset 34
         count_offset = 34
-        if len(payload) < count_offset + 6:
-            return None
-
-        num_layers = payload[count_offset + 4] if len(payload) > count_offset + 4 else 0
-        num_layergen = payload[count_offset + 5] if len(payload) > count_offset + 5 else 0
+        num_layers = payload[count_offset + 4]
 
-        result = {
-            "filename": path.name,
-            "preset_name": path.stem,
-            "preset_num": preset_num,
-            "rom_id": rom_id,
-            "num_layers": num_layers,
-            "filter_params": self.extract_filter_params(data_section),
-            "envelope_params": self.extract_envelope_params(data_section),
-            "lfo_params": self.extract_lfo_params(data_section),
-        }
-
-        return result
-
-    def extract_filter_params(self, data: bytes) -> Dict:
-        """Extract Z-plane filter parameters from data section"""
-        # These are heuristic based on known EMU parameter layouts
-        # Real parsing would require full SysEx spec interpretation
-
-        params = {}
-
-        # Look for typical filter cutoff/resonance patterns
         # Values are usually 7-bit or 14-bit in SysEx
-        if len(data) >= 16:
-            # Attempt to extract cutoff (typically higher values = open filter)
-            cutoff_raw = data[8] | (data[9] << 7 if len(data) > 9 else 0)
-            params["cutoff_raw"] = cutoff_raw
-            params["cutoff_hz"] = self.raw_to_cutoff_hz(cutoff_raw)
-
-            # Attempt to extract resonance
-            res_raw = data[10] if len(data) > 10 else 0
-            params["resonance_raw"] = res_raw
-            params["resonance"] = res_raw / 127.0
-
-        return params
-
-    def extract_envelope_params(self, data: bytes) -> Dict:
-        """Extract envelope parameters"""
-        params = {}
-
-        if len(data) >= 20:
-            # Attack (envelope timing is typically in low bytes)
-            attack_raw = data[12] if len(data) > 12 else 0
-            params["attack_raw"] = attack_raw
-            params["attack_ms"] = self.raw_to_time_ms(attack_raw)
-
-            # Decay
-            decay_raw = data[13] if len(data) > 13 else 0
-            params["decay_raw"] = decay_raw
-            params["decay_ms"] = self.raw_to_time_ms(decay_raw)
-
-            # Sustain level
-            sustain_raw = data[14] if len(data) > 14 else 127
-            params["sustain_raw"] = sustain_raw
-            params["sustain"] = sustain_raw / 127.0
-
-            # Release
-            release_raw = data[15] if len(data) > 15 else 0
-            params["release_raw"] = release_raw
-            params["release_ms"] = self.raw_to_time_ms(release_raw)
-
-        return params
-
-    def extract_lfo_params(self, data: bytes) -> Dict:
-        """Extract LFO parameters"""
-        params = {}
-
-        if len(data) >= 24:
-            # LFO rate
-            rate_raw = data[16] if len(data) > 16 else 64
-            params["rate_raw"] = rate_raw
-            params["rate_hz"] = self.raw_to_lfo_hz(rate_raw)
-
-            # LFO depth/amount
-            depth_raw = data[17] if len(data) > 17 else 0
-            params["depth_raw"] = depth_raw
-            params["depth"] = depth_raw / 127.0
-
-        return params
+        return (
+            path.name,
+            path.stem,
+            preset_num,
+            rom_id,
+            num_layers,
+            data_section[self.DATA_CUTOFF_LSB] | (data_section[self.DATA_CUTOFF_MSB] << 7),
+            data_section[self.DATA_RESONANCE],
+            data_section[self.DATA_ATTACK],
+            data_section[self.DATA_DECAY],
+            data_section[self.DATA_SUSTAIN],
+            data_section[self.DATA_RELEASE],
+            data_section[self.DATA_LFO_RATE],
+            data_section[self.DATA_LFO_DEPTH],
+        )
 
     def raw_to_cutoff_hz(self, raw: int) -> float:
         """Convert raw SysEx value to filter cutoff Hz"""
-        # EMU filters typically range 20Hz to 20kHz
-        # 14-bit value, exponential mapping
-        normalized = raw / 16383.0
-        return 20.0 * (1000.0 ** normalized)
+        return CUTOFF_LUT[raw] if raw < len(CUTOFF_LUT) else _cutoff_hz(raw)
 
     def raw_to_time_ms(self, raw: int) -> float:
         """Convert raw value to envelope time in milliseconds"""
-        # Typical EMU envelope range: 0.5ms to 10s
-        # Exponential curve
-        if raw == 0:
-            return 0.5
-        normalized = raw / 127.0
-        return 0.5 + (10000.0 * (normalized ** 2))
+        return TIME_LUT[raw] if raw < len(TIME_LUT) else _time_ms(raw)
 
     def raw_to_lfo_hz(self, raw: int) -> float:
         """Convert raw value to LFO rate in Hz"""
-        # LFO range typically 0.01 Hz to 100 Hz
-        # Center value (64) = 2 Hz (1 bar @ 120 BPM)
-        if raw < 64:
-            # Below center: 0.01 to 2.0 Hz
-            normalized = raw / 64.0
-            return 0.01 + (1.99 * normalized)
-        else:
-            # Above center: 2.0 to 100 Hz
-            normalized = (raw - 64) / 63.0
-            return 2.0 + (98.0 * normalized)
+        return LFO_LUT[raw] if raw < len(LFO_LUT) else _lfo_hz(raw)
 
 
-def scan_directory(root_path: Path, parser: EmuSysExParser) -> List[Dict]:
+def find_syx_files(root_path: Path) -> List[Path]:
+    """Recursively collect .syx files using os.scandir (cheaper than Path.rglob)"""
+    found = []
+    pending = [os.fspath(root_path)]
+
+    while pending:
+        # Like rglob, silently skip directories we may not list
+        try:
+            it = os.scandir(pending.pop())
+        except PermissionError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                # Case-insensitive, as rglob matches on Windows (.SYX dumps)
+                elif entry.name.lower().endswith(".syx"):
+                    found.append(Path(entry.path))
+        # Reversed onto the stack so siblings pop in scandir order, giving
+        # rglob's pre-order walk
+        pending.extend(reversed(subdirs))
+
+    return found
+
+
+def scan_directory(root_path: Path, parser: EmuSysExParser, max_workers: int = 16) -> PresetSoA:
     """Recursively scan directory for .syx files"""
-    results = []
+    results = PresetSoA()
 
     print(f"Scanning: {root_path}")
 
-    for syx_file in root_path.rglob("*.syx"):
-        parsed = parser.parse_sysex_file(syx_file)
+    syx_files = find_syx_files(root_path)
+
+    # File reads are I/O-bound and release the GIL, so threads hide syscall latency
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parsed_files = list(executor.map(parser.parse_sysex_fields, syx_files))
+
+    lines = []
+    for syx_file, parsed in zip(syx_files, parsed_files):
         if parsed:
             results.append(parsed)
-            print(f"  ✓ {syx_file.name}")
+            lines.append(f"  ✓ {syx_file.name}")
         else:
-            print(f"  ✗ {syx_file.name} (not a valid preset dump)")
+            lines.append(f"  ✗ {syx_file.name} (not a valid preset dump)")
+
+    if lines:
+        print("\n".join(lines))
 
     return results
 
 
+# Filename patterns mapped to bank labels, in priority order
+BANK_LABELS = {"AUDTY": "Audity", "XTREM": "Xtreme", "A2K_USER": "User"}
+BANK_PRIORITY = {pattern: i for i, pattern in enumerate(BANK_LABELS)}
+BANK_RE = re.compile("|".join(BANK_LABELS))
+
+
+def classify_bank(filename: str) -> str:
+    """Extract bank name from filename pattern with a single regex scan"""
+    matches = BANK_RE.findall(filename)
+    if not matches:
+        return "Unknown"
+    # A name containing several patterns keeps the old precedence order
+    return BANK_LABELS[min(matches, key=BANK_PRIORITY.__getitem__)]
+
+
+def classify_banks(filenames: List[str]) -> Dict[str, List[int]]:
+    """Group preset indices by bank, in order of each bank's first appearance"""
+    by_bank = defaultdict(list)
+    for i, filename in enumerate(filenames):
+        by_bank[classify_bank(filename)].append(i)
+    return by_bank
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python extract_real_emu_params.py <A2K_directory> [--output file.json]")
@@ -247,21 +407,12 @@ def main():
     print(f"Extracted {len(results)} presets with real EMU parameters")
     print("=" * 70)
 
-    # Group by subdirectory
-    by_bank = {}
-    for preset in results:
-        # Extract bank name from filename pattern
-        bank = "Unknown"
-        if "AUDTY" in str(preset["filename"]):
-            bank = "Audity"
-        elif "XTREM" in str(preset["filename"]):
-            bank = "Xtreme"
-        elif "A2K_USER" in str(preset["filename"]):
-            bank = "User"
-
-        if bank not in by_bank:
-            by_bank[bank] = []
-        by_bank[bank].append(preset)
+    # Expand columns to per-preset records only for the JSON output
+    records = results.to_records()
+
+    # Group by bank
+    by_bank = {bank: [records[i] for i in indices]
+               for bank, indices in classify_banks(results.filenames).items()}
 
     print("\nBy Bank:")
     for bank, presets in by_bank.items():
@@ -273,11 +424,10 @@ def main():
         "spec": "Proteus Family SysEx 2.2",
         "total_presets": len(results),
         "banks": by_bank,
-        "all_presets": results
+        "all_presets": records
     }
 
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    dump_json(output, output_file)
 
     print(f"\n✅ Saved to: {output_file}")
     print("\nNext step:")
@@ -7,61 +7,121 @@ Usage: python svza_extractor.py <file.bin> [--output results/]
 
 import sys
 import os
+import re
+import itertools
+import mmap
 import zlib
 import struct
 import json
+from functools import lru_cache
 from pathlib import Path
 
 def extract_svza(filepath, output_dir="results"):
     """Extract and decompress SVZa Zenology bank file"""
 
-    with open(filepath, 'rb') as f:
-        data = f.read()
+    output_path = Path(output_dir)
+    basename = Path(filepath).stem
+    raw_file = output_path / f"{basename}_decompressed.bin"
 
-    # Parse SVZa header
-    if data[:4] != b'SVZa':
-        raise ValueError("Not a valid SVZa file")
+    with open(filepath, 'rb') as f:
+        # mmap rejects empty files, so reject anything too short for the magic first
+        if os.fstat(f.fileno()).st_size < 4:
+            raise ValueError("Not a valid SVZa file")
+
+        # Map the file instead of reading it; only touched pages are loaded
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Parse SVZa header
+            if data[:4] != b'SVZa':
+                raise ValueError("Not a valid SVZa file")
+
+            print(f"File: {filepath}")
+            print(f"Size: {len(data)} bytes")
+            print(f"Magic: {data[:4]}")
+
+            # Find compressed data (starts with a zlib header, e.g. 0x789c)
+            starts = iter_zlib_starts(data)
+            first_start = next(starts, None)
+
+            if first_start is None:
+                raise ValueError("No zlib compressed data found")
+
+            # Create output directory
+            output_path.mkdir(exist_ok=True)
+
+            # Decompress in chunks, streaming raw output straight to disk;
+            # a candidate that fails to decompress was a false header match,
+            # so discard its output and try the next one
+            decompressed = None
+            with open(raw_file, 'wb') as out:
+                for zlib_start in itertools.chain([first_start], starts):
+                    out.seek(0)
+                    out.truncate()
+                    try:
+                        decompressed = decompress_stream(data, zlib_start, out)
+                        break
+                    except zlib.error as e:
+                        error = e
+
+            if decompressed is None:
+                raw_file.unlink(missing_ok=True)
+                raise ValueError(f"Decompression failed: {error}")
+
+            print(f"Compressed data starts at offset: 0x{zlib_start:04x}")
+
+    print(f"Decompressed size: {len(decompressed)} bytes")
+    print(f"Saved raw decompressed data: {raw_file}")
 
-    print(f"File: {filepath}")
-    print(f"Size: {len(data)} bytes")
-    print(f"Magic: {data[:4]}")
+    # Analyze decompressed content
+    analyze_decompressed_data(decompressed, output_path, basename)
 
-    # Find compressed data (starts with zlib header 0x789c)
-    zlib_start = None
-    for i in range(len(data) - 1):
-        if data[i:i+2] == b'\x78\x9c':
-            zlib_start = i
-            break
+    return decompressed
 
-    if zlib_start is None:
-        raise ValueError("No zlib compressed data found")
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
 
-    print(f"Compressed data starts at offset: 0x{zlib_start:04x}")
+def decompress_stream(data, start, sink, chunk_size=DECOMPRESS_CHUNK_SIZE):
+    """Decompress the zlib stream at data[start:] chunk by chunk.
 
-    # Extract and decompress
-    compressed_data = data[zlib_start:]
-    try:
-        decompressed = zlib.decompress(compressed_data)
-        print(f"Decompressed size: {len(decompressed)} bytes")
-    except zlib.error as e:
-        raise ValueError(f"Decompression failed: {e}")
+    Each decompressed block is written to sink as it is produced; the
+    full output is also returned as a bytearray for analysis.
+    """
+    decomp = zlib.decompressobj()
+    decompressed = bytearray()
 
-    # Create output directory
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
+    with memoryview(data) as view:
+        for pos in range(start, len(view), chunk_size):
+            block = decomp.decompress(view[pos:pos + chunk_size])
+            sink.write(block)
+            decompressed += block
+            if decomp.eof:
+                break
 
-    # Save decompressed data
-    basename = Path(filepath).stem
-    raw_file = output_path / f"{basename}_decompressed.bin"
-    with open(raw_file, 'wb') as f:
-        f.write(decompressed)
-    print(f"Saved raw decompressed data: {raw_file}")
+    block = decomp.flush()
+    sink.write(block)
+    decompressed += block
 
-    # Analyze decompressed content
-    analyze_decompressed_data(decompressed, output_path, basename)
+    if not decomp.eof:
+        raise zlib.error("incomplete or truncated stream")
 
     return decompressed
 
+# zlib stream headers: default (0x789c), fastest (0x7801) and best (0x78da) levels
+ZLIB_HEADERS = (b'\x78\x9c', b'\x78\x01', b'\x78\xda')
+
+def iter_zlib_starts(data):
+    """Yield offsets of candidate zlib stream headers in data, in ascending order.
+
+    The two-byte markers also occur in ordinary header fields (a size of
+    376 is 78 01 00 00), so callers try each candidate until one decompresses.
+    """
+    next_pos = {marker: data.find(marker) for marker in ZLIB_HEADERS}
+    while True:
+        hits = [(pos, marker) for marker, pos in next_pos.items() if pos >= 0]
+        if not hits:
+            return
+        pos, marker = min(hits)
+        yield pos
+        next_pos[marker] = data.find(marker, pos + 1)
+
 def analyze_decompressed_data(data, output_path, basename):
     """Analyze decompressed Zenology data for EMU content"""
 
@@ -85,30 +145,34 @@ def analyze_decompressed_data(data, output_path, basename):
     try:
         import numpy as np
 
+        # One scratch buffer shared by every alignment instead of a fresh
+        # abs() temporary per offset
+        scratch = np.empty(len(data) // 4, dtype=np.float32)
+
         # Try different alignments for float32 data
         for offset in [0, 4, 8, 16]:
             if offset >= len(data):
                 continue
 
-            aligned_data = data[offset:]
-            if len(aligned_data) % 4 != 0:
-                aligned_data = aligned_data[:-(len(aligned_data) % 4)]
-
-            if len(aligned_data) < 16:
+            n = (len(data) - offset) // 4
+            if n < 4:
                 continue
 
-            floats = np.frombuffer(aligned_data, dtype='<f4')
+            # View the buffer in place rather than slicing a copy
+            floats = np.frombuffer(data, dtype='<f4', count=n, offset=offset)
 
-            # Find reasonable coefficient ranges (-10 to +10 typical for filter coeffs)
-            valid_mask = (np.abs(floats) <= 10.0) & np.isfinite(floats)
+            # Find reasonable coefficient ranges (-10 to +10 typical for filter coeffs).
+            # NaN and +/-inf fail the <= comparison, so this also rejects non-finite values.
+            np.abs(floats, out=scratch[:n])
+            valid_mask = scratch[:n] <= 10.0
 
-            if np.sum(valid_mask) > 100:  # At least 100 valid coefficients
+            if np.count_nonzero(valid_mask) > 100:  # At least 100 valid coefficients
                 valid_floats = floats[valid_mask]
-                coeffs_file = output_path / f"{basename}_coefficients_offset{offset}.csv"
-                np.savetxt(coeffs_file, valid_floats, fmt='%.9g')
+                coeffs_file = output_path / f"{basename}_coefficients_offset{offset}.f32"
+                valid_floats.tofile(coeffs_file)
                 print(f"Found {len(valid_floats)} potential coefficients at offset {offset}")
                 print(f"  Range: {np.min(valid_floats):.6f} to {np.max(valid_floats):.6f}")
-                print(f"  Saved to: {coeffs_file}")
+                print(f"  Saved to: {coeffs_file} (raw little-endian float32)")
 
                 # Look for Z-plane signature patterns
                 if check_zplane_patterns(valid_floats):
@@ -122,22 +186,27 @@ def analyze_decompressed_data(data, output_path, basename):
 
 def find_ascii_strings(data, minlen=6, maxlen=200):
     """Extract ASCII strings from binary data"""
-    strings = []
-    current = []
+    try:
+        import numpy as np
+    except ImportError:
+        return [s.decode('ascii') for s in ascii_run_pattern(minlen, maxlen).findall(data)]
 
-    for b in data:
-        if 32 <= b <= 126:  # Printable ASCII
-            current.append(chr(b))
-        else:
-            if minlen <= len(current) <= maxlen:
-                strings.append(''.join(current))
-            current = []
+    # Mask printable ASCII in one vectorized pass, then locate run edges
+    arr = np.frombuffer(data, dtype=np.uint8)
+    mask = (arr >= 32) & (arr <= 126)
+    edges = np.flatnonzero(np.diff(np.r_[0, mask.view(np.int8), 0]))
+    starts, ends = edges[::2], edges[1::2]
+    lens = ends - starts
+    keep = (lens >= minlen) & (lens <= maxlen)
 
-    # Don't forget the last string
-    if minlen <= len(current) <= maxlen:
-        strings.append(''.join(current))
+    return [bytes(data[s:e]).decode('ascii')
+            for s, e in zip(starts[keep].tolist(), ends[keep].tolist())]
 
-    return strings
+@lru_cache(maxsize=None)
+def ascii_run_pattern(minlen, maxlen):
+    """Compiled regex matching whole printable-ASCII runs of minlen..maxlen bytes"""
+    # Lookarounds keep over-long runs from being split into maxlen-sized pieces
+    return re.compile(rb'(?<![\x20-\x7e])[\x20-\x7e]{%d,%d}(?![\x20-\x7e])' % (minlen, maxlen))
 
 def check_zplane_patterns(floats):
     """Check for Z-plane filter coefficient patterns"""
@@ -166,19 +235,28 @@ def check_zplane_patterns(floats):
 
     return False
 
+# Common EMU strings
+EMU_MARKERS = [b'EMU', b'Audity', b'AUDITY', b'Z-Plane', b'ZPLANE',
+               b'Proteus', b'PROTEUS', b'Morpheus', b'MORPHEUS',
+               b'Vintage', b'VINTAGE', b'Keys', b'KEYS']
+
+# All markers in one alternation: a single scan instead of one per marker.
+# Wrapped in a lookahead so matches can overlap (EMU inside VINTAGEMU); this
+# tries every position, and is exact as no marker is a prefix of another.
+EMU_MARKER_RE = re.compile(b'(?=(' + b'|'.join(re.escape(m) for m in EMU_MARKERS) + b'))')
+
 def check_emu_signatures(data, basename):
     """Look for specific EMU/Audity signatures in the data"""
 
-    # Common EMU strings
-    emu_markers = [b'EMU', b'Audity', b'AUDITY', b'Z-Plane', b'ZPLANE',
-                   b'Proteus', b'PROTEUS', b'Morpheus', b'MORPHEUS',
-                   b'Vintage', b'VINTAGE', b'Keys', b'KEYS']
+    # First offset of each marker, stopping once every marker has been seen
+    first_seen = {}
+    for match in EMU_MARKER_RE.finditer(data):
+        first_seen.setdefault(match.group(1), match.start())
+        if len(first_seen) == len(EMU_MARKERS):
+            break
 
-    found_markers = []
-    for marker in emu_markers:
-        if marker in data:
-            offset = data.find(marker)
-            found_markers.append((marker.decode('ascii', errors='ignore'), offset))
+    found_markers = [(marker.decode('ascii', errors='ignore'), first_seen[marker])
+                     for marker in EMU_MARKERS if marker in first_seen]
 
     if found_markers:
         print(f"\nFound EMU signatures:")
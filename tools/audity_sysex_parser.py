@@ -5,49 +5,178 @@ Extracts Z-plane filter parameters from EMU Audity 2000 preset dumps.
 
 Usage:
     python audity_sysex_parser.py AUDTY/00_0036_REZANATOR.syx
+    python audity_sysex_parser.py AUDTY/ [limit] [--pretty]
     python audity_sysex_parser.py AUDTY/*.syx --output audity_presets.json
+
+Parsed presets are cached in ~/.cache/audity_sysex.json, keyed by file
+mtime and size; set AUDITY_SYSEX_CACHE=0 to disable the cache.
 """
 
+import os
 import sys
 import json
+import functools
+import mmap
 import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import ModuleType
+from typing import Any, BinaryIO, Dict, Final, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast
+
+orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson  # Optional: C-extension JSON, much faster than stdlib
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
+
+# EMU SysEx header: F0 18 04 (Manufacturer ID: E-MU)
+EMU_SYSEX_HEADER: Final = b'\xF0\x18\x04'
+_EMU_HEADER_INT: Final = 0x0418F0  # Same header as a little-endian integer
+
+# Common offsets (these are estimates - need to verify with EMU docs)
+# Z-plane filter parameters typically in the voice section
+FILTER_SECTION_OFFSET: Final = 0x20  # Approximate location
+
+# Below this many files to parse, parsing inline beats a process pool
+# (each preset parses in ~30 µs; worker startup and pickling cost more)
+POOL_MIN_FILES: Final = 5_000
+
+# Preset data (7-bit encoded) starts after F0 18 04 <device ID> <command>
+MIDI_DATA_START: Final = 5
+
+# Filter parameter buffer offsets (preset data offset + MIDI_DATA_START).
+# Common EMU synth parameter layout (approximate) - adjust these offsets
+# based on actual EMU Audity documentation.
+FILTER_FREQ_OFFSET: Final = MIDI_DATA_START + 35    # Filter frequency/cutoff (often byte 32-40 range)
+FILTER_RES_OFFSET: Final = MIDI_DATA_START + 36     # Filter resonance/Q (often near cutoff)
+Z_MORPH_OFFSET: Final = MIDI_DATA_START + 60        # Z-plane morph position (EMU-specific, often byte 50-70 range)
+FILTER_MIX_OFFSET: Final = MIDI_DATA_START + 70     # Mix/amount (often later in parameter list)
+ENV_TO_FILTER_OFFSET: Final = MIDI_DATA_START + 85  # Envelope to filter (modulation section, often byte 80-120)
+LFO_TO_FILTER_OFFSET: Final = MIDI_DATA_START + 90  # LFO to filter
+
+# Filter parameter fields: (name, buffer offset, signed), ascending
+_FIELD_OFFSETS: Final[Tuple[Tuple[str, int, bool], ...]] = (
+    ('filter_freq', FILTER_FREQ_OFFSET, False),
+    ('filter_res', FILTER_RES_OFFSET, False),
+    ('z_morph', Z_MORPH_OFFSET, False),
+    ('filter_mix', FILTER_MIX_OFFSET, False),
+    ('env_to_filter', ENV_TO_FILTER_OFFSET, True),
+    ('lfo_to_filter', LFO_TO_FILTER_OFFSET, True),
+)
+
+# 7-bit unsigned byte -> signed value (-64 to +63), as a plain list so lookups
+# return ints directly. Covers all 256 byte values so malformed data (MSB set)
+# converts as before instead of raising.
+_SIGNED7_I8: Final[List[int]] = [v - 64 if v > 64 else v for v in range(256)]
+
+# Buffer positions of the fields above, and how many leading bytes cover them all
+_FIELD_INDEX: Final[Tuple[int, ...]] = tuple(offset for _, offset, _ in _FIELD_OFFSETS)
+_FIELD_SPAN: Final = _FIELD_INDEX[-1] + 1
+
+# Every field in one unpack: 'B' at each field, pad bytes between them
+_FIELD_STRUCT: Final = struct.Struct(''.join(
+    'x' * (index - prev - 1) + 'B'
+    for prev, index in zip((_FIELD_INDEX[0] - 1,) + _FIELD_INDEX, _FIELD_INDEX)))
+_FIELD_SIGNED: Final[Tuple[bool, ...]] = tuple(signed for _, _, signed in _FIELD_OFFSETS)
+_FIELD_NAMES: Final[Tuple[str, ...]] = tuple(name for name, _, _ in _FIELD_OFFSETS)
+
+
+@dataclass(slots=True)
+class FilterParams:
+    """Z-plane filter parameters of one preset; None where the dump ends first."""
+    filter_freq: Optional[int] = None
+    filter_res: Optional[int] = None
+    z_morph: Optional[int] = None
+    filter_mix: Optional[int] = None
+    env_to_filter: Optional[int] = None
+    lfo_to_filter: Optional[int] = None
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Fields present in the dump, in layout order."""
+        return {name: value for name in _FIELD_NAMES
+                if (value := getattr(self, name)) is not None}
+
+
+def parse_filename(filepath: Path) -> Tuple[int, int, str]:
+    """
+    Split a preset filename like "00_0036_REZANATOR.syx" into
+    (bank, number, name). Non-numeric bank/number fields read as 0.
+    """
+    parts = filepath.stem.split('_', 2)
+    # isdecimal (not isdigit) admits exactly the strings int() accepts here
+    bank = int(parts[0]) if parts[0].isdecimal() else 0
+    number = int(parts[1]) if len(parts) > 1 and parts[1].isdecimal() else 0
+    name = parts[2] if len(parts) > 2 else "Unknown"
+    return bank, number, name
+
+
+def _make_record(name: str, bank: int, number: int, file: str, size_bytes: Optional[int],
+                 is_valid: bool, params: Optional[FilterParams]) -> Dict[str, Any]:
+    """The per-preset output record; every parse path builds it here."""
+    return {
+        'name': name,
+        'bank': bank,
+        'number': number,
+        'file': file,
+        'size_bytes': size_bytes,
+        'is_valid': is_valid,
+        'filter_params': params
+    }
 
 
 class AuditySysExParser:
     """Parse EMU Audity 2000 SysEx preset files."""
     
-    # EMU SysEx header: F0 18 04 (Manufacturer ID: E-MU)
-    EMU_SYSEX_HEADER = b'\xF0\x18\x04'
+    # Re-exported for backward compatibility; methods use the module constants
+    EMU_SYSEX_HEADER = EMU_SYSEX_HEADER
+    FILTER_SECTION_OFFSET = FILTER_SECTION_OFFSET
     
-    # Common offsets (these are estimates - need to verify with EMU docs)
-    # Z-plane filter parameters typically in the voice section
-    FILTER_SECTION_OFFSET = 0x20  # Approximate location
-    
-    def __init__(self, filepath: Path):
-        self.filepath = filepath
-        self.preset_name = filepath.stem.split('_', 2)[-1]  # Extract from "00_0036_REZANATOR"
-        self.data = self._read_file()
+    def __init__(self, filepath: Path, size_bytes: Optional[int] = None):
+        """size_bytes: file size if already known (e.g. from a directory scan)."""
+        self.filepath: Path = filepath
+        self.size_bytes: Optional[int] = size_bytes
+        self._bank: int
+        self._number: int
+        self.preset_name: str
+        self._bank, self._number, self.preset_name = parse_filename(filepath)
+        self._mm: Optional[mmap.mmap] = None
+        self.data: memoryview = self._read_file()
         
-    def _read_file(self) -> bytes:
-        """Read SysEx file."""
+    def _read_file(self) -> memoryview:
+        """Map SysEx file read-only (zero-copy; only touched pages are loaded)."""
         with open(self.filepath, 'rb') as f:
-            return f.read()
+            if self.size_bytes is None:
+                self.size_bytes = os.fstat(f.fileno()).st_size
+            if self.size_bytes == 0:
+                return memoryview(b'')  # mmap cannot map empty files
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._mm)
     
-    def _verify_sysex(self) -> bool:
-        """Verify this is a valid EMU SysEx file."""
-        if not self.data.startswith(self.EMU_SYSEX_HEADER):
-            return False
-        if self.data[-1] != 0xF7:  # SysEx End byte
+    def close(self) -> None:
+        """Release the file mapping."""
+        self.data.release()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+    
+    @functools.cached_property
+    def is_valid(self) -> bool:
+        """Whether this is a valid EMU SysEx file (checked once per preset)."""
+        data = self.data
+        # Shortest valid dump is header + SysEx End
+        if len(data) < 4:
             return False
-        return True
+        hdr = data[0] | (data[1] << 8) | (data[2] << 16)
+        return hdr == _EMU_HEADER_INT and data[-1] == 0xF7  # SysEx End byte
     
-    def extract_filter_params(self) -> Optional[Dict]:
+    def extract_filter_params(self) -> Optional[FilterParams]:
         """
         Extract Z-plane filter parameters from preset.
         
-        Returns dict with:
+        Returns FilterParams with:
             - morph: 0-255 (filter morph position)
             - resonance: 0-255 (filter resonance/Q)
             - cutoff: 0-255 (if separate from morph)
@@ -55,7 +184,7 @@ class AuditySysExParser:
             - env_to_morph: -128 to +127 (envelope modulation depth)
             - lfo_to_morph: -128 to +127 (LFO modulation depth)
         """
-        if not self._verify_sysex():
+        if not self.is_valid:
             return None
         
         # EMU SysEx structure (from reverse engineering):
@@ -64,116 +193,452 @@ class AuditySysExParser:
         # Byte 4: Command (preset dump)
         # Bytes 5+: Preset data (7-bit encoded)
         
-        # Extract 7-bit MIDI data (bytes are 0-127, MSB always 0)
-        midi_data = self.data[5:-1]  # Strip header and footer
+        # Read 7-bit MIDI data (bytes are 0-127, MSB always 0) in place:
+        # fields are indexed straight from the buffer, skipping header and footer
+        data = self.data
+        end = len(data) - 1
         
         # Z-plane filter parameters are typically in voice section
         # This is a HEURISTIC - actual offsets need EMU documentation
-        params = {}
+        if _FIELD_SPAN <= end:
+            # Complete dump: read all fields in a single C call
+            values = _FIELD_STRUCT.unpack_from(data, _FIELD_INDEX[0])
+            return FilterParams(*[_SIGNED7_I8[value] if signed else value
+                                  for signed, value in zip(_FIELD_SIGNED, values)])
         
-        try:
-            # Common EMU synth parameter layout (approximate)
-            # Adjust these offsets based on actual EMU Audity documentation
-            
-            # Filter frequency/cutoff (often byte 32-40 range)
-            if len(midi_data) > 35:
-                params['filter_freq'] = midi_data[35]
-            
-            # Filter resonance/Q (often near cutoff)
-            if len(midi_data) > 36:
-                params['filter_res'] = midi_data[36]
-            
-            # Z-plane morph position (EMU-specific, often byte 50-70 range)
-            if len(midi_data) > 60:
-                params['z_morph'] = midi_data[60]
-            
-            # Mix/amount (often later in parameter list)
-            if len(midi_data) > 70:
-                params['filter_mix'] = midi_data[70]
-            
-            # Envelope to filter (modulation section, often byte 80-120)
-            if len(midi_data) > 85:
-                # Convert from 7-bit unsigned to signed (-64 to +63)
-                env_depth = midi_data[85]
-                params['env_to_filter'] = env_depth - 64 if env_depth > 64 else env_depth
-            
-            # LFO to filter
-            if len(midi_data) > 90:
-                lfo_depth = midi_data[90]
-                params['lfo_to_filter'] = lfo_depth - 64 if lfo_depth > 64 else lfo_depth
-            
-        except IndexError:
-            return None
+        # Truncated dump: only the fields before the SysEx End byte
+        params: Dict[str, int] = {}
         
-        return params
-    
-    def to_dict(self) -> Dict:
-        """Convert preset to dictionary."""
-        # Parse filename: "00_0036_REZANATOR.syx"
-        parts = self.filepath.stem.split('_')
-        bank = int(parts[0]) if len(parts) > 0 else 0
-        number = int(parts[1]) if len(parts) > 1 else 0
-        name = parts[2] if len(parts) > 2 else "Unknown"
+        for name, i, signed in _FIELD_OFFSETS:
+            if i >= end:
+                break  # Offsets are ascending, so every later field is missing too
+            params[name] = _SIGNED7_I8[data[i]] if signed else data[i]
         
-        params = self.extract_filter_params()
-        
-        return {
-            'name': name,
-            'bank': bank,
-            'number': number,
-            'file': str(self.filepath.name),
-            'size_bytes': len(self.data),
-            'is_valid': self._verify_sysex(),
-            'filter_params': params
-        }
-
-
-def parse_preset(filepath: Path) -> Dict:
-    """Parse a single preset file."""
-    parser = AuditySysExParser(filepath)
+        return FilterParams(**params)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert preset to dictionary (releases the file mapping)."""
+        try:
+            params = self.extract_filter_params()
+            
+            return _make_record(self.preset_name, self._bank, self._number, self.filepath.name,
+                                self.size_bytes, self.is_valid, params)
+        finally:
+            self.close()
+
+
+# Parsed presets persisted across runs:
+# {"version": _CACHE_VERSION, "presets": {path: [mtime_ns, size, preset]}}
+_CACHE_PATH: Final = Path.home() / '.cache' / 'audity_sysex.json'
+# Bump whenever the record format or field extraction changes, so presets
+# parsed by an older version of this script are never served
+_CACHE_VERSION: Final = 1
+# Set AUDITY_SYSEX_CACHE=0 to neither read nor write the cache
+_CACHE_ENABLED: Final = os.environ.get('AUDITY_SYSEX_CACHE', '1') != '0'
+_cache: Optional[Dict[str, List[Any]]] = None
+_cache_dirty = False
+_cache_seen: Set[str] = set()  # Slots looked up or stored in this run
+
+# Cache slot and stat fingerprint: (resolved path, mtime_ns, size)
+CacheKey = Tuple[str, int, int]
+
+
+def _load_cache() -> Dict[str, List[Any]]:
+    """Load the preset cache from disk once (empty if missing, unreadable or stale)."""
+    global _cache
+    if _cache is None:
+        _cache = {}
+        try:
+            raw = _CACHE_PATH.read_bytes()
+            doc = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return _cache
+        if isinstance(doc, dict) and doc.get('version') == _CACHE_VERSION:
+            _cache = doc['presets']
+    return _cache
+
+
+def save_cache() -> None:
+    """
+    Write the preset cache back to disk if it changed, dropping entries for
+    files that no longer exist. Failure to write only warns: the cache must
+    never fail a run.
+    """
+    global _cache, _cache_dirty
+    if not _CACHE_ENABLED or _cache is None:
+        return
+    live = {path: entry for path, entry in _cache.items()
+            if path in _cache_seen or os.path.exists(path)}
+    if not _cache_dirty and len(live) == len(_cache):
+        return
+    _cache = live
+    doc = {'version': _CACHE_VERSION, 'presets': live}
+    raw = orjson.dumps(doc) if orjson is not None else json.dumps(doc).encode()
+    tmp = _CACHE_PATH.with_suffix('.tmp')
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(raw)
+        os.replace(tmp, _CACHE_PATH)  # Never leave a half-written cache behind
+    except OSError as e:
+        print(f"Warning: could not write cache {_CACHE_PATH}: {e}", file=sys.stderr)
+        return
+    _cache_dirty = False
+
+
+def _cache_key(filepath: Path) -> CacheKey:
+    """Cache slot and stat fingerprint for a preset file."""
+    st = os.stat(filepath)
+    return str(filepath.parent.resolve() / filepath.name), st.st_mtime_ns, st.st_size
+
+
+def _cache_lookup(key: CacheKey) -> Optional[Dict[str, Any]]:
+    """Cached preset for key, or None if the file changed since it was parsed."""
+    if not _CACHE_ENABLED:
+        return None
+    path, mtime_ns, size = key
+    _cache_seen.add(path)
+    entry = _load_cache().get(path)
+    if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+        preset = entry[2]
+        params = preset['filter_params']
+        return dict(preset, filter_params=None if params is None else FilterParams(**params))
+    return None
+
+
+def _cache_store(key: CacheKey, preset: Dict[str, Any]) -> None:
+    global _cache_dirty
+    if not _CACHE_ENABLED:
+        return
+    path, mtime_ns, size = key
+    _cache_seen.add(path)
+    _load_cache()[path] = [mtime_ns, size, preset_to_json(preset)]
+    _cache_dirty = True
+
+
+def _parse_file(filepath: Path, size_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """Parse a preset file, bypassing the cache."""
+    parser = AuditySysExParser(filepath, size_bytes)
     return parser.to_dict()
 
 
-def parse_directory(directory: Path, limit: int = None) -> List[Dict]:
-    """Parse all presets in a directory."""
-    presets = []
-    syx_files = sorted(directory.glob('*.syx'))
+def parse_preset(filepath: Path) -> Dict[str, Any]:
+    """Parse a single preset file (unchanged files are served from the cache)."""
+    key = _cache_key(filepath)
+    preset = _cache_lookup(key)
+    if preset is None:
+        preset = _parse_file(filepath, key[2])
+        _cache_store(key, preset)
+    return preset
+
+
+def _parse_preset_safe(filepath: Path, size_bytes: int) -> Tuple[Path, Union[Dict[str, Any], Exception]]:
+    """Parse a preset in a worker, returning (filepath, preset or exception)."""
+    try:
+        return filepath, _parse_file(filepath, size_bytes)
+    except Exception as e:
+        return filepath, e
+
+
+def _scan_syx(directory: Path, limit: Optional[int] = None) -> List[os.DirEntry]:
+    """.syx entries of a directory, sorted by name (DirEntry caches stat)."""
+    with os.scandir(directory) as it:
+        # Case-insensitive, as glob matches on Windows (.SYX dumps)
+        entries = [e for e in it if e.name.lower().endswith('.syx')]
+    entries.sort(key=lambda e: e.name)
     
     if limit:
-        syx_files = syx_files[:limit]
+        entries = entries[:limit]
     
-    for filepath in syx_files:
+    return entries
+
+
+def _may_be_emu(filepath: Path, size_bytes: int) -> bool:
+    """Cheap pre-parse check: file is long enough and starts with the EMU header."""
+    if size_bytes < 4:
+        return False  # Shorter than header + SysEx End, never valid
+    try:
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            return os.read(fd, len(EMU_SYSEX_HEADER)) == EMU_SYSEX_HEADER
+        finally:
+            os.close(fd)
+    except OSError:
+        return True  # Let the full parse report the error
+
+
+def _rejected_preset(filepath: Path, size_bytes: int) -> Dict[str, Any]:
+    """Record for a file that failed _may_be_emu, as to_dict would report it."""
+    bank, number, name = parse_filename(filepath)
+    return _make_record(name, bank, number, filepath.name, size_bytes, False, None)
+
+
+def parse_directory(directory: Path, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Parse all presets in a directory, yielding each (large batches parse in parallel)."""
+    # Only files changed since the last run go to the workers; the cache
+    # lives in this process, so lookups and stores happen here. Keys match
+    # _cache_key, but reuse the scandir stat and resolve the directory once.
+    root = directory.resolve()
+    syx_files: List[Path] = []
+    keys: List[CacheKey] = []
+    for e in _scan_syx(directory, limit):
         try:
-            preset = parse_preset(filepath)
-            presets.append(preset)
-        except Exception as e:
-            print(f"Error parsing {filepath.name}: {e}", file=sys.stderr)
+            st = e.stat()
+        except OSError as err:  # Dangling symlink, file removed mid-scan, ...
+            print(f"Error parsing {e.name}: {err}", file=sys.stderr)
+            continue
+        syx_files.append(Path(e.path))
+        keys.append((str(root / e.name), st.st_mtime_ns, st.st_size))
+    resolved = [_cache_lookup(key) for key in keys]
+    
+    # Non-EMU or truncated files are answered from a 3-byte peek (or the
+    # size alone) instead of a full parse in a worker
+    for i, (filepath, key) in enumerate(zip(syx_files, keys)):
+        if resolved[i] is None and not _may_be_emu(filepath, key[2]):
+            rejected = _rejected_preset(filepath, key[2])
+            _cache_store(key, rejected)
+            resolved[i] = rejected
+    
+    stale = [(filepath, key[2]) for filepath, key, preset in zip(syx_files, keys, resolved)
+             if preset is None]
+    if not stale:
+        # Nothing left to parse, so every slot is filled
+        yield from cast(List[Dict[str, Any]], resolved)
+        return
+    
+    # Failures come back as values so one bad file doesn't abort the batch
+    if len(stale) >= POOL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            yield from _merge_results(keys, resolved,
+                                      ex.map(_parse_preset_safe, *zip(*stale), chunksize=64))
+    else:
+        yield from _merge_results(keys, resolved, map(_parse_preset_safe, *zip(*stale)))
+
+
+def _merge_results(keys: List[CacheKey], resolved: List[Optional[Dict[str, Any]]],
+                   results: Iterator[Tuple[Path, Union[Dict[str, Any], Exception]]]
+                   ) -> Iterator[Dict[str, Any]]:
+    """Yield presets in file order, filling unresolved slots from results."""
+    for key, preset in zip(keys, resolved):
+        if preset is not None:
+            yield preset
+            continue
+        filepath, result = next(results)
+        if isinstance(result, Exception):
+            print(f"Error parsing {filepath.name}: {result}", file=sys.stderr)
+        else:
+            _cache_store(key, result)
+            yield result
+
+
+def _read_into(filepath: Path, slot: memoryview) -> Union[int, OSError]:
+    """
+    Read a file into its slot of the pooled buffer, returning bytes read
+    (or the error, so one unreadable file doesn't abort the batch).
+    """
+    try:
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            if hasattr(os, 'readv'):
+                return os.readv(fd, [slot])  # Straight into the pool, no copy
+            chunk = os.read(fd, len(slot))
+            slot[:len(chunk)] = chunk
+            return len(chunk)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return e
+
+
+def parse_directory_soa(directory: Path, limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Parse all presets in a directory into columnar NumPy arrays, in one
+    vectorized pass (NumPy required).
+    
+    Returns a dict of equal-length arrays, one row per preset in file-name order:
+        - name, file: object arrays of str
+        - bank, number, size_bytes: int64
+        - is_valid: bool
+        - field_count: uint8, filter fields held by the dump (0 if invalid);
+          present fields are always a prefix of the layout order
+        - filter_freq, filter_res, z_morph, filter_mix: uint8
+        - env_to_filter, lfo_to_filter: int16 (signed)
+    Filter columns read 0 where a field is missing. Files that cannot be
+    stat'ed or read are reported on stderr and left out, as in parse_directory.
+    """
+    # Imported here, not at module level: only the vectorized paths need it,
+    # and the CLI shouldn't pay for loading it
+    import numpy as np
+    
+    syx_files: List[Path] = []
+    stat_sizes: List[int] = []
+    for e in _scan_syx(directory, limit):
+        try:
+            stat_sizes.append(e.stat().st_size)
+        except OSError as err:
+            print(f"Error parsing {e.name}: {err}", file=sys.stderr)
+            continue
+        syx_files.append(Path(e.path))
+    count = len(syx_files)
+    
+    # Presets are tiny, so per-file open/map/unmap dominates: read every file
+    # into one pooled buffer instead, overlapping the reads across threads
+    sizes = np.array(stat_sizes, dtype=np.int64)
+    offsets = np.zeros(count, dtype=np.int64)
+    np.cumsum(sizes[:-1], out=offsets[1:])
+    pool = bytearray(int(sizes.sum()) + 1)  # +1 so clamped gathers stay in bounds
+    view = memoryview(pool)
+    slots = [view[start:start + size] for start, size in zip(offsets.tolist(), sizes.tolist())]
+    with ThreadPoolExecutor() as ex:
+        results = list(ex.map(_read_into, syx_files, slots))
+    for slot in slots:
+        slot.release()
+    view.release()
+    
+    # Drop the rows of files that failed to read
+    ok = np.ones(count, dtype=bool)
+    for row, (filepath, result) in enumerate(zip(syx_files, results)):
+        if isinstance(result, OSError):
+            print(f"Error parsing {filepath.name}: {result}", file=sys.stderr)
+            ok[row] = False
+        else:
+            sizes[row] = result
+    if not ok.all():
+        syx_files = [filepath for filepath, keep in zip(syx_files, ok.tolist()) if keep]
+        sizes, offsets = sizes[ok], offsets[ok]
+        count = len(syx_files)
+    buf = np.frombuffer(pool, dtype=np.uint8)
+    
+    # Only the leading bytes holding the header and fields, plus the final
+    # byte, are needed, so rows are gathered to the field span rather than
+    # to the longest file (bytes past a file's end read as 0)
+    span = np.arange(_FIELD_SPAN)
+    head = np.where(span < sizes[:, None],
+                    buf[np.minimum(offsets[:, None] + span, buf.size - 1)], 0).astype(np.uint8)
+    last = np.where(sizes > 0, buf[np.maximum(offsets + sizes - 1, 0)], 0)
+    
+    header = np.frombuffer(EMU_SYSEX_HEADER, dtype=np.uint8)
+    valid = (sizes >= len(header)) & np.all(head[:, :len(header)] == header, axis=1) & (last == 0xF7)
+    
+    # Gather every field for every preset at once; a field is present only if
+    # it lies before the SysEx End byte
+    index = np.array(_FIELD_INDEX)
+    values = head[:, index]
+    signed = np.array(_FIELD_SIGNED)
+    values = np.where(signed, np.array(_SIGNED7_I8, dtype=np.int16)[values], values)
+    present = index < (sizes - 1)[:, None]
+    
+    field_count = np.where(valid, present.sum(axis=1), 0).astype(np.uint8)
+    
+    bank, number, name = zip(*map(parse_filename, syx_files)) if count else ((), (), ())
+    columns: Dict[str, Any] = {
+        'name': np.array(name, dtype=object),
+        'bank': np.fromiter(bank, dtype=np.int64, count=count),
+        'number': np.fromiter(number, dtype=np.int64, count=count),
+        'file': np.array([filepath.name for filepath in syx_files], dtype=object),
+        'size_bytes': sizes,
+        'is_valid': valid,
+        'field_count': field_count,
+    }
+    keep = np.arange(len(_FIELD_NAMES)) < field_count[:, None]
+    for col, (field, is_signed) in enumerate(zip(_FIELD_NAMES, _FIELD_SIGNED)):
+        column = np.where(keep[:, col], values[:, col], 0)
+        columns[field] = column.astype(np.int16 if is_signed else np.uint8)
+    
+    return columns
+
+
+def parse_directory_fast(directory: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Parse all presets in a directory in one vectorized pass.
+    
+    Same output as parse_directory, built row by row from parse_directory_soa
+    so the header check and field extraction run as NumPy gathers instead of
+    per-preset Python code. Falls back to parse_directory when NumPy is unavailable.
+    """
+    try:
+        soa = parse_directory_soa(directory, limit)
+    except ImportError:
+        return list(parse_directory(directory, limit))
+    fields = [soa[field].tolist() for field in _FIELD_NAMES]
+    
+    presets: List[Dict[str, Any]] = []
+    for row, (name, bank, number, file, size_bytes, is_valid, field_count) in enumerate(zip(
+            soa['name'].tolist(), soa['bank'].tolist(), soa['number'].tolist(),
+            soa['file'].tolist(), soa['size_bytes'].tolist(), soa['is_valid'].tolist(),
+            soa['field_count'].tolist())):
+        params = None
+        if is_valid:
+            params = FilterParams(*[column[row] if col < field_count else None
+                                    for col, column in enumerate(fields)])
+        presets.append(_make_record(name, bank, number, file, size_bytes, is_valid, params))
     
     return presets
 
 
-def main():
+def preset_to_json(preset: Dict[str, Any]) -> Dict[str, Any]:
+    """Preset with its FilterParams flattened to a plain dict (JSON-ready)."""
+    params = preset['filter_params']
+    if params is None:
+        return preset
+    return dict(preset, filter_params=params.to_dict())
+
+
+def dump_preset(preset: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize one preset to JSON bytes, via orjson when available."""
+    preset = preset_to_json(preset)
+    if orjson is not None:
+        return orjson.dumps(preset, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(preset, indent=2 if pretty else None).encode()
+
+
+def write_presets(presets: Iterable[Dict[str, Any]], out: BinaryIO, pretty: bool = False) -> None:
+    """
+    Stream {"presets": [...]} to a binary file one record at a time,
+    so the full document is never held in memory.
+    """
+    # Pretty mode nests each indented record two levels deep in the list
+    lead = b'\n    ' if pretty else b''
+    
+    out.write(b'{\n  "presets": [' if pretty else b'{"presets":[')
+    count = 0
+    for preset in presets:
+        if count:
+            out.write(b',')
+        out.write(lead)
+        out.write(dump_preset(preset, pretty).replace(b'\n', lead) if pretty else dump_preset(preset))
+        count += 1
+    if pretty:
+        out.write(b'\n  ]\n}\n' if count else b']\n}\n')
+    else:
+        out.write(b']}\n')
+
+
+def main() -> None:
     """CLI interface."""
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg != '--pretty']
+    pretty = len(args) != len(sys.argv) - 1
+    
+    if not args:
         print(__doc__)
         sys.exit(1)
     
-    input_path = Path(sys.argv[1])
+    input_path = Path(args[0])
     
     if input_path.is_file():
         # Parse single file
         preset = parse_preset(input_path)
-        print(json.dumps(preset, indent=2))
+        sys.stdout.buffer.write(dump_preset(preset, pretty=True) + b'\n')
     
     elif input_path.is_dir():
         # Parse directory
-        limit = int(sys.argv[2]) if len(sys.argv) > 2 else None
-        presets = parse_directory(input_path, limit)
-        print(json.dumps({'presets': presets}, indent=2))
+        limit = int(args[1]) if len(args) > 1 else None
+        write_presets(parse_directory(input_path, limit), sys.stdout.buffer, pretty)
     
     else:
         print(f"Error: {input_path} not found", file=sys.stderr)
         sys.exit(1)
+    
+    save_cache()
 
 
 if __name__ == '__main__':